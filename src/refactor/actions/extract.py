@@ -5,13 +5,16 @@ Extract action for extracting hardcoded strings from Laravel files.
 import sys
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Optional, List, Tuple
 
 from refactor.utils.file_finder import find_files_iter
 from refactor.utils.output_formatter import format_output
 from refactor.utils.string_processor import StringCollector
 from refactor.utils.exclusion_dict import ExclusionMatcher
+from refactor.data_models.extracted_string import ExtractedString
 from refactor.mods.blade_processor import BladeProcessor
 from refactor.mods.php_processor import PHPProcessor
 
@@ -90,6 +93,14 @@ def setup_extract_parser(subparsers) -> None:
         dest="exclude_dict",
         help="Path to a text file containing strings to exclude (one per line)",
     )
+    extract_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        dest="jobs",
+        help="Number of worker processes for file analysis (default: CPU count, 1 to process files in the main process)",
+    )
     extract_parser.set_defaults(func=run_extract)
 
 
@@ -118,6 +129,7 @@ def run_extract(args) -> int:
         enable_blade=args.enable_blade,
         enable_php=args.enable_php,
         exclude_dict_path=args.exclude_dict,
+        jobs=args.jobs,
     )
 
 
@@ -252,6 +264,7 @@ def extract_strings(
     enable_blade: bool,
     enable_php: bool,
     exclude_dict_path: Optional[Path],
+    jobs: Optional[int] = None,
 ) -> int:
     """
     Extract hardcoded strings from Laravel project files.
@@ -268,6 +281,7 @@ def extract_strings(
         enable_blade: Enable processing of .blade.php files
         enable_php: Enable processing of regular .php files
         exclude_dict_path: Path to exclusion dictionary file
+        jobs: Number of worker processes for file analysis (None: CPU count, 1: no worker processes)
 
     Returns:
         Exit code (0 for success, 1 for error)
@@ -282,6 +296,11 @@ def extract_strings(
             print(f"Error: Path is not a directory: {directory}", file=sys.stderr)
             return 1
 
+        # Validate worker count
+        if jobs is not None and jobs < 1:
+            print(f"Error: Number of jobs must be 1 or greater: {jobs}", file=sys.stderr)
+            return 1
+
         # Use provided exclusions or empty list
         if exclude_dirs is None:
             exclude_dirs = []
@@ -340,7 +359,8 @@ def extract_strings(
         except (AttributeError, OSError):
             terminal_width = 80
 
-        for index, file_path in enumerate(files, 1):
+        # Files are analyzed in worker processes; results arrive in file order
+        for index, (file_path, results, error) in enumerate(analyze_files(files, min_bytes, enable_blade, enable_php, jobs), 1):
             try:
                 # Show progress: display current file being processed
                 # Use relative path from directory for cleaner display
@@ -368,22 +388,16 @@ def extract_strings(
                 # \033[K clears from cursor to end of line
                 print(f"\r\033[K{progress_msg}", end="", flush=True, file=sys.stderr)
 
-                # Determine file type and process accordingly
-                is_blade = file_path.suffix == ".php" and ".blade.php" in file_path.name
-                is_php = file_path.suffix == ".php" and ".blade.php" not in file_path.name
-
-                if is_blade and enable_blade:
-                    # Blade template
-                    results = process_blade_file(file_path, collector, min_bytes, context_lines)
-                    processed_count += 1
-                elif is_php and enable_php:
-                    # Regular PHP file
-                    results = process_php_file(file_path, collector, min_bytes, context_lines)
-                    processed_count += 1
-                else:
-                    # Skip if file type is disabled
+                if error is not None:
+                    raise RuntimeError(error)
+
+                # Skip if file type is disabled
+                if results is None:
                     continue
 
+                collect_file_results(file_path, results, collector, context_lines)
+                processed_count += 1
+
             except Exception as e:
                 error_count += 1
                 # Clear the progress line before printing error
@@ -394,13 +408,13 @@ def extract_strings(
         # Clear the progress line after processing all files
         print("\r\033[K", end="", file=sys.stderr)
 
-        # Get consolidated results
+        # Get consolidated results (built one text at a time while writing)
         print("Consolidating results...", file=sys.stderr)
-        results = collector.get_results()
+        results = collector.iter_results(sort_by_text=True)
 
         # Output results
         print("Writing output...", file=sys.stderr)
-        output_files = format_output(results, output_path, split_threshold)
+        output_files = format_output(results, output_path, split_threshold, presorted=True, total_items=collector.get_string_count())
 
         # Print summary to stderr
         print(f"\nProcessed {processed_count} files", file=sys.stderr)
@@ -478,66 +492,152 @@ Process all entries in the file(s) and return the complete modified JSON.
         return 1
 
 
-def process_blade_file(file_path: Path, collector: StringCollector, min_bytes: int, context_lines: int) -> int:
+def get_file_type(file_path: Path, enable_blade: bool, enable_php: bool) -> Optional[str]:
     """
-    Process a Blade template file.
+    Determine how a file should be processed.
 
     Args:
-        file_path: Path to the Blade file
-        collector: StringCollector instance
+        file_path: Path to the file
+        enable_blade: Enable processing of .blade.php files
+        enable_php: Enable processing of regular .php files
+
+    Returns:
+        "blade" or "php", or None if the file type is disabled
+    """
+    is_blade = file_path.suffix == ".php" and ".blade.php" in file_path.name
+    is_php = file_path.suffix == ".php" and ".blade.php" not in file_path.name
+
+    if is_blade and enable_blade:
+        return "blade"
+    if is_php and enable_php:
+        return "php"
+    return None
+
+
+def analyze_file(file_path: Path, min_bytes: int, file_type: str) -> Tuple[Optional[List[ExtractedString]], Optional[str]]:
+    """
+    Extract strings from a single file.
+
+    Runs in worker processes, so errors are returned as messages instead of raised.
+
+    Args:
+        file_path: Path to the file
         min_bytes: Minimum byte length for string extraction
-        context_lines: Number of context lines to include (0 to disable)
+        file_type: "blade" or "php" (see get_file_type)
 
     Returns:
-        Number of strings extracted
+        Tuple of (extracted strings, None) on success, or (None, error message) on failure
     """
-    processor = BladeProcessor(file_path, min_bytes)
-    results = processor.process()
+    try:
+        if file_type == "blade":
+            return BladeProcessor(file_path, min_bytes).process(), None
+        return PHPProcessor(file_path, min_bytes).process(), None
+    except Exception as e:
+        return None, str(e)
 
-    # Read file content for context extraction if needed
-    file_lines = None
-    if context_lines > 0:
-        with open(file_path, "r", encoding="utf-8") as f:
-            file_lines = f.readlines()
 
-    for extracted in results:
-        context = None
-        if context_lines > 0 and file_lines is not None:
-            context = extract_context_lines(file_lines, extracted.line, context_lines)
-        collector.add_string(extracted.text, file_path, extracted.line, extracted.column, extracted.length, context)
+def analyze_files(
+    files: List[Path], min_bytes: int, enable_blade: bool, enable_php: bool, jobs: Optional[int] = None
+) -> Iterator[Tuple[Path, Optional[List[ExtractedString]], Optional[str]]]:
+    """
+    Extract strings from files, in parallel worker processes when there is more than one file.
+
+    Args:
+        files: Files to process
+        min_bytes: Minimum byte length for string extraction
+        enable_blade: Enable processing of .blade.php files
+        enable_php: Enable processing of regular .php files
+        jobs: Number of worker processes (None: CPU count, 1: process files in this process)
 
-    return len(results)
+    Yields:
+        Tuples of (file_path, extracted strings, error message) in the order of files.
+        Extracted strings and error message are both None for files whose type is disabled.
+    """
+    file_types = [get_file_type(file_path, enable_blade, enable_php) for file_path in files]
+    targets = [(file_path, file_type) for file_path, file_type in zip(files, file_types) if file_type is not None]
+    target_paths = [file_path for file_path, _file_type in targets]
+    target_types = [file_type for _file_path, file_type in targets]
+
+    workers = min(jobs or os.cpu_count() or 1, len(targets))
+
+    if workers <= 1:
+        yield from _merge_file_results(files, file_types, map(analyze_file, target_paths, repeat(min_bytes), target_types))
+        return
 
+    yield from _merge_file_results(files, file_types, _analyze_in_pool(target_paths, target_types, min_bytes, workers))
 
-def process_php_file(file_path: Path, collector: StringCollector, min_bytes: int, context_lines: int) -> int:
+
+def _analyze_in_pool(
+    target_paths: List[Path], target_types: List[str], min_bytes: int, workers: int
+) -> Iterator[Tuple[Optional[List[ExtractedString]], Optional[str]]]:
     """
-    Process a PHP file.
+    Analyze files in worker processes, falling back to this process if the pool fails.
+
+    analyze_file reports its own errors, so any exception while collecting outcomes is a pool
+    failure (e.g., BrokenProcessPool, a result that cannot be pickled). The files that have no
+    outcome yet are then analyzed in this process instead of aborting the whole run.
 
     Args:
-        file_path: Path to the PHP file
-        collector: StringCollector instance
+        target_paths: Files to analyze
+        target_types: File type of each file (see get_file_type)
         min_bytes: Minimum byte length for string extraction
-        context_lines: Number of context lines to include (0 to disable)
+        workers: Number of worker processes
 
-    Returns:
-        Number of strings extracted
+    Yields:
+        Tuples of (extracted strings, error message) in the order of target_paths
+    """
+    completed = 0
+    try:
+        # Each worker imports the analyzers, whose patterns are compiled once at class definition time
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(target_paths) // (workers * 4))
+            for outcome in executor.map(analyze_file, target_paths, repeat(min_bytes), target_types, chunksize=chunksize):
+                yield outcome
+                completed += 1
+    except Exception as e:
+        # Clear the progress line before printing the warning
+        print("\r\033[K", end="", file=sys.stderr)
+        print(f"Warning: Worker processes failed ({type(e).__name__}: {e}), analyzing remaining files in the main process", file=sys.stderr)
+
+    yield from map(analyze_file, target_paths[completed:], repeat(min_bytes), target_types[completed:])
+
+
+def _merge_file_results(
+    files: List[Path], file_types: List[Optional[str]], outcomes: Iterator[Tuple[Optional[List[ExtractedString]], Optional[str]]]
+) -> Iterator[Tuple[Path, Optional[List[ExtractedString]], Optional[str]]]:
+    """Pair analysis outcomes with their files, filling in disabled files."""
+    for file_path, file_type in zip(files, file_types):
+        if file_type is None:
+            yield file_path, None, None
+        else:
+            results, error = next(outcomes)
+            yield file_path, results, error
+
+
+def collect_file_results(file_path: Path, results: List[ExtractedString], collector: StringCollector, context_lines: int) -> None:
     """
-    processor = PHPProcessor(file_path, min_bytes)
-    results = processor.process()
+    Add strings extracted from a file to the collector.
 
+    Args:
+        file_path: Path to the processed file
+        results: Strings extracted from the file
+        collector: StringCollector instance
+        context_lines: Number of context lines to include (0 to disable)
+    """
     # Read file content for context extraction if needed
     file_lines = None
     if context_lines > 0:
         with open(file_path, "r", encoding="utf-8") as f:
             file_lines = f.readlines()
 
+    # Resolve the file path once for all of its strings
+    absolute_path = str(file_path.resolve())
+
     for extracted in results:
         context = None
         if context_lines > 0 and file_lines is not None:
             context = extract_context_lines(file_lines, extracted.line, context_lines)
-        collector.add_string(extracted.text, file_path, extracted.line, extracted.column, extracted.length, context)
-
-    return len(results)
+        collector.add_string(extracted.text, absolute_path, extracted.line, extracted.column, extracted.length, context)
 
 
 def extract_context_lines(file_lines: List[str], target_line: int, context_lines: int) -> List[str]:
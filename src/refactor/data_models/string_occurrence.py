@@ -8,6 +8,9 @@ from typing import Any, Dict, List, Optional
 class StringOccurrence:
     """Represents a single occurrence of a string."""
 
+    # One instance per collected occurrence, so skip the per-instance __dict__
+    __slots__ = ("line", "column", "length", "context")
+
     def __init__(self, line: int, column: int, length: int, context: Optional[List[str]] = None):
         """
         Initialize a string occurrence.
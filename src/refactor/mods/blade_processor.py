@@ -3,39 +3,54 @@ Blade template processor for extracting hardcoded strings.
 """
 
 import re
+from bisect import bisect_right
 from typing import List, Tuple, Set
 from pathlib import Path
 from bs4 import BeautifulSoup, Comment, Tag
 from bs4.element import NavigableString
 from ..data_models.extracted_string import ExtractedString
 from ..utils.php_analyzer import PHPAnalyzer
-from ..utils.string_processor import StringProcessor
+from ..utils.string_processor import LineIndex, StringProcessor
 
 
 class BladeProcessor:
     """Processes Blade templates to extract hardcoded strings."""
 
     # Patterns for Blade constructs to exclude
+    # Patterns are compiled once at class definition time and shared by all instances
     BLADE_TRANSLATION_PATTERNS = [
-        r"\{\{\s*__\(",  # {{ __() }}
-        r"\{\{\s*trans\(",  # {{ trans() }}
-        r"\{!!\s*__\(",  # {!! __() !!}
-        r"\{!!\s*trans\(",  # {!! trans() !!}
-        r"@lang\(",  # @lang()
+        re.compile(r"\{\{\s*__\("),  # {{ __() }}
+        re.compile(r"\{\{\s*trans\("),  # {{ trans() }}
+        re.compile(r"\{!!\s*__\("),  # {!! __() !!}
+        re.compile(r"\{!!\s*trans\("),  # {!! trans() !!}
+        re.compile(r"@lang\("),  # @lang()
     ]
 
     BLADE_VARIABLE_PATTERNS = [
-        r"\{\{\s*\$",  # {{ $variable }}
-        r"\{!!\s*\$",  # {!! $variable !!}
+        re.compile(r"\{\{\s*\$"),  # {{ $variable }}
+        re.compile(r"\{!!\s*\$"),  # {!! $variable !!}
     ]
 
     # Blade directives (with or without parentheses)
-    BLADE_DIRECTIVE_PATTERN = r"@\w+"  # @if, @foreach, @endif, @endforeach, etc.
+    BLADE_DIRECTIVE_PATTERN = re.compile(r"@\w+")  # @if, @foreach, @endif, @endforeach, etc.
 
     # Blade directives with parentheses (generic pattern for all directives with arguments)
     # Matches @directiveName( where directiveName is one or more word characters
     # Examples: @include(, @class(, @push(, @component(, @slot(, etc.
-    BLADE_DIRECTIVE_WITH_ARGS_PATTERN = r"@\w+\s*\("
+    BLADE_DIRECTIVE_WITH_ARGS_PATTERN = re.compile(r"@\w+\s*\(")
+
+    # Comments removed before HTML parsing
+    BLADE_COMMENT_PATTERN = re.compile(r"\{\{--.*?--\}\}", re.DOTALL)  # {{-- ... --}}
+    HTML_COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.DOTALL)  # <!-- ... -->
+
+    # <style> tags (CSS code - never internationalized)
+    STYLE_TAG_PATTERN = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
+
+    # JavaScript string literals in <script> tags (single and double quoted)
+    SCRIPT_STRING_PATTERN = re.compile(r'(["\'])(?:(?=(\\?))\2.)*?\1')
+
+    # JavaScript function call argument: functionName( or object.method( before a string
+    SCRIPT_CALL_ARGUMENT_PATTERN = re.compile(r"[\w\.]\s*\($")
 
     # Pattern to detect if string contains Blade syntax
     BLADE_SYNTAX_PATTERN = re.compile(
@@ -57,6 +72,7 @@ class BladeProcessor:
         self.file_path = file_path
         self.min_bytes = min_bytes
         self.content = ""
+        self.line_index = LineIndex("")  # Line/column lookups for self.content
         self.excluded_ranges: Set[Tuple[int, int]] = set()
         self.php_ranges = []  # List of (start_pos, end_pos) tuples for PHP blocks
         self.php_analyzer = PHPAnalyzer(min_bytes)
@@ -82,6 +98,7 @@ class BladeProcessor:
         # Read file content
         with open(self.file_path, "r", encoding="utf-8") as f:
             self.content = f.read()
+        self.line_index = LineIndex(self.content)
 
         # Step 1: Extract PHP code ranges ONCE - will be reused by:
         # - _identify_excluded_ranges() to mark PHP blocks as excluded
@@ -117,7 +134,7 @@ class BladeProcessor:
                 continue
 
             # Check if position is in excluded range (translation functions, variables, PHP blocks)
-            pos = StringProcessor.get_position_from_line_column(self.content, line, adjusted_column)
+            pos = self.line_index.get_position(line, adjusted_column)
             if self._is_in_excluded_range(pos):
                 continue
 
@@ -137,6 +154,11 @@ class BladeProcessor:
         """
         results = []
 
+        if not self.php_ranges:
+            return results
+
+        line_starts = self.line_index.offsets
+
         # Process each PHP range
         for start_pos, end_pos in self.php_ranges:
             # Extract PHP block content
@@ -145,14 +167,17 @@ class BladeProcessor:
             # Use PHPAnalyzer to extract and validate strings
             validated_strings = self.php_analyzer.extract_and_validate_strings(php_content, StringProcessor.should_extract_string)
 
+            # Line index (0-based) where the block starts in the original file
+            base_index = bisect_right(line_starts, start_pos) - 1
+
             # Convert relative positions to absolute positions in the original file
             for text, relative_line, relative_column, length in validated_strings:
-                # Calculate absolute position
-                relative_pos = StringProcessor.get_position_from_line_column(php_content, relative_line, relative_column)
-                absolute_pos = start_pos + relative_pos
-                absolute_line, absolute_column = StringProcessor.get_line_column(self.content, absolute_pos)
+                # Block lines after the first start where the original file's lines start
+                line_start = line_starts[base_index + relative_line - 1] if relative_line > 1 else start_pos
+                absolute_pos = line_start + relative_column
 
-                results.append((text, absolute_line, absolute_column, length))
+                absolute_index = bisect_right(line_starts, absolute_pos) - 1
+                results.append((text, absolute_index + 1, absolute_pos - line_starts[absolute_index], length))
 
         return results
 
@@ -178,12 +203,12 @@ class BladeProcessor:
 
         # Exclude translation function calls
         for pattern in self.BLADE_TRANSLATION_PATTERNS:
-            if re.search(pattern, text):
+            if pattern.search(text):
                 return True
 
         # Exclude variable expansions
         for pattern in self.BLADE_VARIABLE_PATTERNS:
-            if re.search(pattern, text):
+            if pattern.search(text):
                 return True
 
         # Use common validation logic (inverted - should_extract returns True if we want it)
@@ -200,10 +225,10 @@ class BladeProcessor:
             Content with comments removed
         """
         # Remove Blade comments {{-- ... --}}
-        content = re.sub(r"\{\{--.*?--\}\}", "", content, flags=re.DOTALL)
+        content = self.BLADE_COMMENT_PATTERN.sub("", content)
 
         # Remove HTML comments <!-- ... -->
-        content = re.sub(r"<!--.*?-->", "", content, flags=re.DOTALL)
+        content = self.HTML_COMMENT_PATTERN.sub("", content)
 
         return content
 
@@ -232,12 +257,12 @@ class BladeProcessor:
 
         # Find and exclude <style> tags (CSS code should never be extracted)
         # Match <style...>...</style> including multiline content
-        for match in re.finditer(r"<style[^>]*>.*?</style>", content, re.DOTALL | re.IGNORECASE):
+        for match in self.STYLE_TAG_PATTERN.finditer(content):
             self.excluded_ranges.add((match.start(), match.end()))
 
         # Find translation functions
         for pattern in self.BLADE_TRANSLATION_PATTERNS:
-            for match in re.finditer(pattern, content):
+            for match in pattern.finditer(content):
                 start = match.start()
                 # Find the closing bracket/brace
                 end = self._find_closing_bracket(content, start)
@@ -246,7 +271,7 @@ class BladeProcessor:
 
         # Find variable expansions
         for pattern in self.BLADE_VARIABLE_PATTERNS:
-            for match in re.finditer(pattern, content):
+            for match in pattern.finditer(content):
                 start = match.start()
                 end = self._find_closing_bracket(content, start)
                 if end > start:
@@ -254,7 +279,7 @@ class BladeProcessor:
 
         # Find Blade directives with arguments (special handling)
         # These will be parsed as PHP code to exclude array keys
-        for match in re.finditer(self.BLADE_DIRECTIVE_WITH_ARGS_PATTERN, content):
+        for match in self.BLADE_DIRECTIVE_WITH_ARGS_PATTERN.finditer(content):
             start = match.start()
             # Find the closing parenthesis for the directive arguments
             end = self._find_closing_parenthesis(content, match.end() - 1)
@@ -262,7 +287,7 @@ class BladeProcessor:
                 self.excluded_ranges.add((start, end + 1))  # +1 to include closing )
 
         # Find other Blade directives (without arguments)
-        for match in re.finditer(self.BLADE_DIRECTIVE_PATTERN, content):
+        for match in self.BLADE_DIRECTIVE_PATTERN.finditer(content):
             # Skip if already covered by directives with arrays
             already_excluded = False
             for start, end in self.excluded_ranges:
@@ -432,7 +457,7 @@ class BladeProcessor:
             if pos == -1:
                 break
 
-            line, column = StringProcessor.get_line_column(self.content, pos)
+            line, column = self.line_index.get_line_column(pos)
             results.append((line, column, text_length))
             search_pos = pos + text_length
 
@@ -493,7 +518,7 @@ class BladeProcessor:
 
                             # Position of value (after =" )
                             value_pos = pos + len(attr_name) + 2
-                            line, column = StringProcessor.get_line_column(self.content, value_pos)
+                            line, column = self.line_index.get_line_column(value_pos)
                             results.append((attr_value, line, column, len(attr_value)))
 
                             search_pos = pos + len(search_pattern)
@@ -537,10 +562,7 @@ class BladeProcessor:
             script_content_start = script_opening_end + 1
 
             # Find JavaScript string literals
-            # Match both single and double quoted strings
-            string_pattern = r'(["\'])(?:(?=(\\?))\2.)*?\1'
-
-            for match in re.finditer(string_pattern, script_content):
+            for match in self.SCRIPT_STRING_PATTERN.finditer(script_content):
                 string_with_quotes = match.group(0)
                 # Remove quotes
                 string_value = string_with_quotes[1:-1]
@@ -553,7 +575,7 @@ class BladeProcessor:
 
                     # Skip if it's a function call argument
                     # Patterns: func( 'string' or func('string' or object.method( 'string'
-                    if re.search(r"[\w\.]\s*\($", before_string):
+                    if self.SCRIPT_CALL_ARGUMENT_PATTERN.search(before_string):
                         continue
 
                     # Find position in ORIGINAL content, starting from this script tag's content
@@ -565,7 +587,7 @@ class BladeProcessor:
                     if pos != -1 and not self._is_in_excluded_range(pos):
                         # Position of string content (excluding quotes)
                         value_pos = pos + 1
-                        line, column = StringProcessor.get_line_column(self.content, value_pos)
+                        line, column = self.line_index.get_line_column(value_pos)
                         results.append((string_value, line, column, len(string_value)))
 
         return results
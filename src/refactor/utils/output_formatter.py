@@ -3,16 +3,24 @@ Output formatter for extracted strings.
 """
 
 import json
+import sys
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import IO, Iterable, Iterator, List, Dict, Any, Optional
 
 
-def format_output(results: List[Dict[str, Any]], output_path: Optional[Path] = None, split_threshold: Optional[int] = None) -> Optional[List[Path]]:
+def format_output(
+    results: Iterable[Dict[str, Any]],
+    output_path: Optional[Path] = None,
+    split_threshold: Optional[int] = None,
+    presorted: bool = False,
+    total_items: Optional[int] = None,
+) -> Optional[List[Path]]:
     """
     Format and output the extraction results as JSON.
 
     Args:
-        results: List of extraction results with structure:
+        results: Extraction results (a list or any iterable) with structure:
             [
                 {
                     "text": "extracted string",
@@ -28,36 +36,47 @@ def format_output(results: List[Dict[str, Any]], output_path: Optional[Path] = N
             ]
         output_path: Output file path. If None, writes to stdout.
         split_threshold: Threshold for splitting output into multiple files.
+        presorted: Whether results are already sorted by text
+            (e.g. StringCollector.iter_results(sort_by_text=True)). If False, results are sorted
+            by text here. If True, items are written as they are consumed instead of being
+            collected into a list first.
+        total_items: Number of items in presorted results, needed to split the output without
+            collecting them. Ignored unless presorted is True; counted from results if None.
 
     Returns:
         List of output file paths if output_path is specified, None otherwise.
     """
-    # Sort results by text for consistency
-    sorted_results = sorted(results, key=lambda x: x.get("text", ""))
+    if not presorted:
+        # Sort results by text for consistency
+        results = sorted(results, key=lambda x: x.get("text", ""))
+        total_items = len(results)
+    elif total_items is None:
+        results = list(results)
+        total_items = len(results)
 
     if output_path:
         # Write to file(s) with splitting if necessary
-        return _write_to_files(sorted_results, output_path, split_threshold)
+        return _write_to_files(iter(results), total_items, output_path, split_threshold)
     else:
         # Write to stdout without splitting
-        json_output = json.dumps(sorted_results, ensure_ascii=False, indent=2, sort_keys=False)
-        print(json_output)
+        _write_json_items(results, sys.stdout)
+        sys.stdout.write("\n")
         return None
 
 
-def _write_to_files(results: List[Dict[str, Any]], output_path: Path, split_threshold: Optional[int]) -> List[Path]:
+def _write_to_files(results: Iterator[Dict[str, Any]], total_items: int, output_path: Path, split_threshold: Optional[int]) -> List[Path]:
     """
     Write results to one or more files, splitting if necessary.
 
     Args:
-        results: Sorted list of extraction results
+        results: Iterator over the sorted extraction results
+        total_items: Number of items in results
         output_path: Base output file path
         split_threshold: Threshold for splitting output into multiple files
 
     Returns:
         List of output file paths
     """
-    total_items = len(results)
     output_files = []
 
     if split_threshold == None or total_items <= split_threshold:
@@ -78,9 +97,8 @@ def _write_to_files(results: List[Dict[str, Any]], output_path: Path, split_thre
         suffix = output_path.suffix  # .json
 
         for file_index in range(num_files):
-            start_idx = file_index * split_threshold
-            end_idx = min(start_idx + split_threshold, total_items)
-            chunk = results[start_idx:end_idx]
+            # Next split_threshold items (the last chunk takes the remainder)
+            chunk = islice(results, split_threshold)
 
             # Generate filename with zero-padded number (01, 02, ...)
             file_number = str(file_index + 1).zfill(width)
@@ -92,7 +110,7 @@ def _write_to_files(results: List[Dict[str, Any]], output_path: Path, split_thre
     return output_files
 
 
-def _write_json_file(data: List[Dict[str, Any]], file_path: Path) -> None:
+def _write_json_file(data: Iterable[Dict[str, Any]], file_path: Path) -> None:
     """
     Write data to a JSON file.
 
@@ -104,11 +122,31 @@ def _write_json_file(data: List[Dict[str, Any]], file_path: Path) -> None:
         The caller should check if the output directory exists and prompt the user
         for creation if needed. This function creates directories as a safety fallback.
     """
-    json_output = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=False)
-
     # Create directories if they don't exist (safety fallback)
     # The caller should have already verified directory existence with user prompt
     file_path.parent.mkdir(parents=True, exist_ok=True)
     with open(file_path, "w", encoding="utf-8") as f:
-        f.write(json_output)
+        _write_json_items(data, f)
         f.write("\n")  # Add trailing newline
+
+
+def _write_json_items(items: Iterable[Dict[str, Any]], stream: IO[str]) -> None:
+    """
+    Write items as a JSON array, one item at a time.
+
+    The output is identical to json.dumps(list(items), ensure_ascii=False, indent=2),
+    but only one item is serialized in memory at a time.
+
+    Args:
+        items: Items to write
+        stream: Text stream to write to
+    """
+    separator = "[\n  "
+    for item in items:
+        stream.write(separator)
+        # Newlines only come from indentation (newlines in strings are escaped), so nest by one level
+        stream.write(json.dumps(item, ensure_ascii=False, indent=2, sort_keys=False).replace("\n", "\n  "))
+        separator = ",\n  "
+
+    # An empty array has no items to close
+    stream.write("[]" if separator == "[\n  " else "\n]")
@@ -11,10 +11,118 @@ This module combines functionality from:
 - php_string_extractor.py
 """
 
+import heapq
 import re
-from typing import List, Tuple
+from array import array
+from bisect import bisect_right
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+from refactor.utils.string_processor import LineIndex
+
+# All scanning works on str rather than encoded bytes: ASCII-only source is already stored
+# one byte per character, and byte offsets would not match the character positions reported
+# for source containing non-ASCII text.
+
+# Characters that need attention while matching parentheses/braces, keyed by opening bracket.
+# Everything in between is skipped in bulk by the regex engine instead of char by char.
+_BRACKET_STOP_PATTERNS = {
+    "(": re.compile(r"""/\*|//|#|["'()]"""),
+    "{": re.compile(r"""/\*|//|#|["'{}]"""),
+}
+
+# Remainder of a string literal after its opening quote (escaped characters are skipped)
+_STRING_TAIL_PATTERNS = {
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*'", re.DOTALL),
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL),
+}
+
+# "=>" after an array key, optionally preceded by the closing quote (see _is_array_key)
+_ARRAY_KEY_ARROW_PATTERN = re.compile(r"""\s*(?:['"]\s*)?=>""")
+
+# First token after an array key's closing quote on the same line: "=>" or "]" (see _is_array_key)
+_ARRAY_KEY_AFTER_PATTERN = re.compile(r"\s*(=>|\])")
+
+# PHP tokens relevant to string extraction, matched in one pass (see extract_string_literals):
+# - comment: complete comment (single-line comments include their newline)
+# - string: complete single or double quoted string literal (escaped characters are skipped)
+# - bracket: parenthesis or brace
+# - unclosed: comment or string start that never ends, which ends the scan
+_TOKEN_PATTERN = re.compile(
+    r"""(?P<comment>/\*.*?\*/|//[^\n]*\n|\#[^\n]*\n)"""
+    r"""|(?P<string>'[^'\\]*(?:\\.[^'\\]*)*'|"[^"\\]*(?:\\.[^"\\]*)*")"""
+    r"""|(?P<bracket>[(){}])"""
+    r"""|(?P<unclosed>/\*|//|\#|["'])""",
+    re.DOTALL,
+)
+
+# Comment start, quote, or PHP block end marker, keyed by end marker (see find_block_end)
+_BLOCK_END_STOP_PATTERNS = {marker: re.compile(rf"""/\*|//|#|["']|{re.escape(marker)}""") for marker in ("?>", "@endphp")}
+
+
+def _build_excluded_call_index(
+    excluded_functions: Iterable[str], plain_functions: Iterable[str]
+) -> Tuple[FrozenSet[str], Dict[str, Tuple[str, ...]], Pattern[str], Pattern[str]]:
+    """
+    Index excluded function names for identifier lookups on call sites.
+
+    Args:
+        excluded_functions: Excluded functions and statements (see PHPAnalyzer.EXCLUDED_FUNCTIONS)
+        plain_functions: Additional plain function names (regex, PHP builtin, Laravel helper functions)
+
+    Returns:
+        Tuple of:
+        - Names excluded wherever they are called ("func", matched with a word boundary)
+        - Name -> prefixes that must directly precede it ("Class::method", "@directive")
+        - Pattern matching only the "regex:" entries (statements such as echo/print)
+        - Single pattern matching, in one pass, either a "regex:" entry (the "statement" group)
+          or a call site (the "name" group: identifier followed by an opening parenthesis)
+    """
+    names = set(plain_functions)
+    prefixed_names: Dict[str, Tuple[str, ...]] = {}
+    statement_patterns = []
+
+    for func in excluded_functions:
+        if func.startswith("regex:"):
+            statement_patterns.append(func[6:])
+        elif "::" in func or func.startswith("@"):
+            # Class::method -> "method" preceded by "Class::", @directive -> "directive" preceded by "@"
+            split_pos = func.rindex(":") + 1 if "::" in func else 1
+            name = func[split_pos:]
+            prefixed_names[name] = prefixed_names.get(name, ()) + (func[:split_pos],)
+        else:
+            names.add(func)
+
+    # Statements come first so that "echo (" is not consumed as a call site; (?!) never matches
+    statement_pattern = "|".join(statement_patterns) or "(?!)"
+    search_pattern = re.compile(rf"(?P<statement>{statement_pattern})|\b(?P<name>\w+)\s*\(")
+    return frozenset(names), prefixed_names, re.compile(statement_pattern), search_pattern
+
+
+def _build_excluded_range_pattern(definitions: Iterable[Tuple[str, str, str]]) -> Pattern[str]:
+    """
+    Build one compiled regex matching excluded function definitions and call sites.
 
-from refactor.utils.string_processor import StringProcessor
+    A match sets either the "definition" group (one of the excluded function definitions)
+    or the "name" group (identifier of a call site, to be looked up in the excluded name sets).
+
+    Args:
+        definitions: (access_level, function_name, return_type) tuples
+
+    Returns:
+        Compiled regex pattern
+    """
+    definition_patterns = []
+
+    for access_level, func_name, return_type in definitions:
+        # Pattern: EXACT access level + function + EXACT function name + EXACT return type
+        # Example: "protected function casts(): array"
+        # \b ensures word boundary (no partial matches)
+        # \s* allows for flexible whitespace
+        definition_patterns.append(rf"{re.escape(access_level)}\s+function\s+\b{re.escape(func_name)}\b\s*\(\s*\)\s*:\s*{re.escape(return_type)}")
+
+    # (?!) never matches, for an empty definition list
+    definition_pattern = "|".join(definition_patterns) or "(?!)"
+    return re.compile(rf"(?P<definition>{definition_pattern})|\b(?P<name>\w+)\s*\(")
 
 
 class PHPAnalyzer:
@@ -32,7 +140,7 @@ class PHPAnalyzer:
     # - Static methods: "Class::method" -> generates Class::method\s*\(
     # - Blade directives: "@directive" -> generates @directive\s*\(
     # - Regex patterns (with regex: prefix): "regex:pattern" -> uses pattern as-is
-    EXCLUDED_FUNCTIONS = [
+    EXCLUDED_FUNCTIONS = (
         # Translation functions (Laravel i18n)
         "__",
         "trans",
@@ -58,10 +166,10 @@ class PHPAnalyzer:
         "Log::notice",
         "Log::info",
         "Log::debug",
-    ]
+    )
 
     # Class instance methods
-    CLASS_INSTANCE_METHODS = [
+    CLASS_INSTANCE_METHODS = (
         # Artisan command output methods
         "info",
         "error",
@@ -91,7 +199,7 @@ class PHPAnalyzer:
         # Validation methods
         "validate",
         "validateWithBag",
-    ]
+    )
 
     # Function definitions to exclude entirely (including function body)
     # STRICT MODE: To prevent accidental exclusions, these patterns are highly specific.
@@ -100,13 +208,13 @@ class PHPAnalyzer:
     # - function_name: Exact function name
     # - return_type: Required return type hint (e.g., "array")
     # All three components must match for exclusion.
-    EXCLUDED_FUNCTION_DEFINITIONS = [
+    EXCLUDED_FUNCTION_DEFINITIONS = (
         ("protected", "casts", "array"),
         ("public", "rules", "array"),
-    ]
+    )
 
     # Regular expression functions
-    REGEX_FUNCTIONS = [
+    REGEX_FUNCTIONS = (
         "preg_match",
         "preg_match_all",
         "preg_replace",
@@ -115,10 +223,10 @@ class PHPAnalyzer:
         "preg_filter",
         "preg_grep",
         "preg_split",
-    ]
+    )
 
     # PHP builtin functions that take string arguments
-    PHP_BUILTIN_FUNCTIONS = [
+    PHP_BUILTIN_FUNCTIONS = (
         # Class/Function/Constant existence checks
         "function_exists",
         "class_exists",
@@ -191,10 +299,10 @@ class PHPAnalyzer:
         # URL functions
         "parse_url",
         "http_build_query",
-    ]
+    )
 
     # Laravel helper functions that take string arguments
-    LARAVEL_HELPER_FUNCTIONS = [
+    LARAVEL_HELPER_FUNCTIONS = (
         # Path helpers
         "app_path",
         "base_path",
@@ -277,7 +385,16 @@ class PHPAnalyzer:
         "transform",
         "value",
         "with",
-    ]
+    )
+
+    # Excluded function names indexed for hash lookups on call site identifiers
+    _EXCLUDED_CALL_NAMES, _EXCLUDED_PREFIXED_CALL_NAMES, _EXCLUDED_STATEMENT_PATTERN, _EXCLUSION_SEARCH_PATTERN = _build_excluded_call_index(
+        EXCLUDED_FUNCTIONS, (*REGEX_FUNCTIONS, *PHP_BUILTIN_FUNCTIONS, *LARAVEL_HELPER_FUNCTIONS)
+    )
+    _EXCLUDED_METHOD_NAMES = frozenset(CLASS_INSTANCE_METHODS)
+
+    # Excluded function definitions and call sites, found together in one pass over content
+    _EXCLUDED_RANGE_PATTERN = _build_excluded_range_pattern(EXCLUDED_FUNCTION_DEFINITIONS)
 
     def __init__(self, min_bytes: int = 2):
         """
@@ -287,65 +404,13 @@ class PHPAnalyzer:
             min_bytes: Minimum byte length for string extraction (default: 2)
         """
         self.min_bytes = min_bytes
-        self._compiled_patterns = None
         self._excluded_ranges = []  # List of (start_pos, end_pos) for excluded function calls
-
-    def _get_exclusion_patterns(self) -> List[str]:
-        """
-        Build regex patterns from function/method name lists.
-
-        All patterns are used to identify function/method calls whose entire
-        argument list should be excluded from string extraction.
-
-        Pattern format in EXCLUDED_FUNCTIONS:
-        - Simple name: "func" -> r"\\bfunc\\s*\\("
-        - Static method: "Class::method" -> r"Class::method\\s*\\("
-        - Blade directive: "@directive" -> r"@directive\\s*\\("
-        - Regex pattern: "regex:pattern" -> pattern (used as-is)
-
-        Returns:
-            List of regex patterns for exclusion checking
-        """
-        if self._compiled_patterns is not None:
-            return self._compiled_patterns
-
-        patterns = []
-
-        # Excluded functions and statements
-        for func in self.EXCLUDED_FUNCTIONS:
-            if func.startswith("regex:"):
-                # Custom regex pattern - use as-is
-                patterns.append(func[6:])  # Remove "regex:" prefix
-            elif "::" in func:
-                # Static method calls: Class::method(
-                patterns.append(rf"{re.escape(func)}\s*\(")
-            elif func.startswith("@"):
-                # Blade directives: @lang(
-                patterns.append(rf"{re.escape(func)}\s*\(")
-            else:
-                # Regular function calls: function(
-                patterns.append(rf"\b{re.escape(func)}\s*\(")
-
-        # Class instance methods (command output + Eloquent)
-        for method in self.CLASS_INSTANCE_METHODS:
-            patterns.append(rf"\$this->{re.escape(method)}\s*\(")  # Command output: $this->info()
-            patterns.append(rf"->{re.escape(method)}\s*\(")  # Eloquent instance: ->where()
-            patterns.append(rf"::{re.escape(method)}\s*\(")  # Eloquent static: ::select()
-
-        # Regex functions
-        for func in self.REGEX_FUNCTIONS:
-            patterns.append(rf"\b{re.escape(func)}\s*\(")
-
-        # PHP builtin functions
-        for func in self.PHP_BUILTIN_FUNCTIONS:
-            patterns.append(rf"\b{re.escape(func)}\s*\(")
-
-        # Laravel helper functions
-        for func in self.LARAVEL_HELPER_FUNCTIONS:
-            patterns.append(rf"\b{re.escape(func)}\s*\(")
-
-        self._compiled_patterns = patterns
-        return patterns
+        # Excluded ranges merged into sorted, non-overlapping start/end positions (see _pack_excluded_ranges)
+        self._excluded_starts = array("q")
+        self._excluded_ends = array("q")
+        self._exclusion_end_cache: Dict[str, int] = {}  # Line text -> end of its first excluded function call
+        self._line_index_cache: Tuple[Optional[str], Optional[LineIndex]] = (None, None)  # (content, its line index)
+        self._bracket_match_cache: Tuple[Optional[str], Dict[Tuple[str, int], int]] = (None, {})  # (content, (bracket, pos) -> match)
 
     def extract_and_validate_strings(self, content: str, validator_func) -> List[Tuple[str, int, int, int]]:
         """
@@ -363,26 +428,34 @@ class PHPAnalyzer:
         """
         results = []
 
-        # Step 1: Identify all excluded ranges
-        self._identify_excluded_function_ranges(content)  # Excluded function calls
-        self._identify_excluded_function_definitions(content)  # Excluded function definitions
+        # Line index is shared by all position and context lookups for this content
+        line_index = self._get_line_index(content)
+        line_starts = line_index.offsets
+        self._exclusion_end_cache = {}
 
-        # Step 2: Extract all string literals
+        # Step 1: Extract all string literals (also pairs up the brackets used below)
         string_literals = self.extract_string_literals(content)
 
-        # Step 3: Validate and filter
-        for text, line, column, _length in string_literals:
-            stripped_text = text.strip()
-            if not stripped_text:
+        # Step 2: Identify all excluded ranges
+        self._identify_excluded_ranges(content)  # Excluded function calls and definitions
+        self._pack_excluded_ranges()
+
+        # Step 3: Classify all string positions against the excluded ranges in one pass
+        positions = [line_starts[line - 1] + column for _text, line, column, _length in string_literals]
+        excluded_flags = self._get_excluded_position_flags(positions)
+
+        # Step 4: Validate and filter
+        for (text, line, column, _length), excluded in zip(string_literals, excluded_flags):
+            # Skip strings within any excluded range before any per-string work
+            if excluded:
                 continue
 
-            # Check if string position is within any excluded range
-            position = StringProcessor.get_position_from_line_column(content, line, column)
-            if self._is_in_excluded_function_range(position):
+            stripped_text = text.strip()
+            if not stripped_text:
                 continue
 
             # Use validation with context
-            if self.should_include_string(stripped_text, content, line, column, validator_func):
+            if self.should_include_string(stripped_text, content, line, column, validator_func, line_index):
                 # Calculate position for stripped text
                 leading_whitespace = len(text) - len(text.lstrip())
                 adjusted_column = column + leading_whitespace
@@ -394,7 +467,7 @@ class PHPAnalyzer:
     # ========== PHP Block Detection ==========
 
     @staticmethod
-    def find_block_end(content: str, start_pos: int, end_marker: str, end_marker_length: int) -> int:
+    def find_block_end(content: str, start_pos: int, end_marker: str) -> int:
         """
         Find the end marker that is not inside a string literal or comment.
 
@@ -409,66 +482,50 @@ class PHPAnalyzer:
             content: Full content to search
             start_pos: Position to start searching from
             end_marker: End marker to find (e.g., "?>", "@endphp")
-            end_marker_length: Length of end marker
 
         Returns:
             Position of end marker, or -1 if not found
         """
+        stop_pattern = _BLOCK_END_STOP_PATTERNS.get(end_marker)
+        if stop_pattern is None:
+            stop_pattern = re.compile(rf"""/\*|//|#|["']|{re.escape(end_marker)}""")
         i = start_pos
 
-        while i < len(content) - (end_marker_length - 1):
-            char = content[i]
+        while True:
+            # Jump straight to the next comment start, quote, or end marker
+            match = stop_pattern.search(content, i)
+            if match is None:
+                return -1
+
+            token = match.group()
+            i = match.start()
 
             # Skip multi-line comments /* ... */
-            if i + 1 < len(content) and content[i : i + 2] == "/*":
+            if token == "/*":
                 end = content.find("*/", i + 2)
-                if end != -1:
-                    i = end + 2
-                    continue
-                else:
+                if end == -1:
                     return -1  # Unclosed comment
-
-            # Skip single-line comments //
-            if i + 1 < len(content) and content[i : i + 2] == "//":
-                end = content.find("\n", i + 2)
-                if end != -1:
-                    i = end + 1
-                else:
-                    return -1  # Comment to end of file
+                i = end + 2
                 continue
 
-            # Skip shell-style comments #
-            if char == "#":
-                end = content.find("\n", i + 1)
-                if end != -1:
-                    i = end + 1
-                else:
+            # Skip single-line comments // and shell-style comments #
+            if token in ("//", "#"):
+                end = content.find("\n", i + len(token))
+                if end == -1:
                     return -1  # Comment to end of file
+                i = end + 1
                 continue
 
-            # Check for string literals
-            if char in ('"', "'"):
-                quote = char
-                i += 1
-                # Skip through string, handling escapes
-                while i < len(content):
-                    if content[i] == "\\" and i + 1 < len(content):
-                        i += 2  # Skip escaped character
-                        continue
-                    elif content[i] == quote:
-                        i += 1
-                        break
-                    else:
-                        i += 1
+            # Skip string literals in one step
+            if token in ('"', "'"):
+                string_match = _STRING_TAIL_PATTERNS[token].match(content, i + 1)
+                if string_match is None:
+                    return -1  # Unclosed string
+                i = string_match.end()
                 continue
 
-            # Check for end marker
-            if content[i : i + end_marker_length] == end_marker:
-                return i
-
-            i += 1
-
-        return -1
+            # End marker outside strings and comments
+            return i
 
     @staticmethod
     def extract_php_ranges(content: str, detect_blade: bool = False) -> List[Tuple[int, int]]:
@@ -491,7 +548,9 @@ class PHPAnalyzer:
         Returns:
             List of (start_pos, end_pos) tuples representing PHP code ranges
         """
-        ranges = []
+        # Each kind of block is found in ascending order, so both lists are already sorted
+        php_ranges = []
+        blade_ranges = []
 
         # Find <?php ... ?> blocks
         pos = 0
@@ -502,13 +561,13 @@ class PHPAnalyzer:
                 break
 
             # Find closing tag, skipping those in strings and comments
-            php_end = PHPAnalyzer.find_block_end(content, php_start + 5, "?>", 2)
+            php_end = PHPAnalyzer.find_block_end(content, php_start + 5, "?>")
             if php_end == -1:
                 # No closing tag, PHP goes to end of file
-                ranges.append((php_start, len(content)))
+                php_ranges.append((php_start, len(content)))
                 break
             else:
-                ranges.append((php_start, php_end + 2))  # +2 to include ?>
+                php_ranges.append((php_start, php_end + 2))  # +2 to include ?>
                 pos = php_end + 2
 
         # Find @php ... @endphp blocks (only for Blade files)
@@ -525,10 +584,10 @@ class PHPAnalyzer:
                     continue
 
                 # Find @endphp, skipping those in strings and comments
-                blade_php_end = PHPAnalyzer.find_block_end(content, blade_php_start + 4, "@endphp", 7)
+                blade_php_end = PHPAnalyzer.find_block_end(content, blade_php_start + 4, "@endphp")
                 if blade_php_end == -1:
                     # No @endphp, assume it goes to end of file
-                    ranges.append((blade_php_start, len(content)))
+                    blade_ranges.append((blade_php_start, len(content)))
                     break
                 else:
                     # Check if @endphp is not part of another word
@@ -536,22 +595,18 @@ class PHPAnalyzer:
                         pos = blade_php_end + 1
                         continue
 
-                    ranges.append((blade_php_start, blade_php_end + 7))  # +7 to include @endphp
+                    blade_ranges.append((blade_php_start, blade_php_end + 7))  # +7 to include @endphp
                     pos = blade_php_end + 7
 
-        # Sort and merge overlapping ranges
-        if ranges:
-            ranges.sort()
-            merged = [ranges[0]]
-            for start, end in ranges[1:]:
-                if start <= merged[-1][1]:
-                    # Overlapping or adjacent, merge
-                    merged[-1] = (merged[-1][0], max(merged[-1][1], end))
-                else:
-                    merged.append((start, end))
-            return merged
+        # Merge the sorted lists linearly, joining overlapping or adjacent ranges
+        merged: List[Tuple[int, int]] = []
+        for start, end in heapq.merge(php_ranges, blade_ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
 
-        return ranges
+        return merged
 
     # ========== PHP String Extraction ==========
 
@@ -559,6 +614,10 @@ class PHPAnalyzer:
         """
         Extract all string literals from PHP code.
 
+        The same pass pairs up every parenthesis and brace outside strings and comments,
+        and stores the pairs as the bracket matches of this content (see _get_matching_bracket),
+        so excluded ranges need no further scans for brackets in code.
+
         Args:
             content: PHP content
 
@@ -566,75 +625,54 @@ class PHPAnalyzer:
             List of tuples: (text, line, column, length)
         """
         results = []
-        i = 0
+        line_starts = self._get_line_index(content).offsets
+        bracket_matches: Dict[Tuple[str, int], int] = {}
+        open_positions: Dict[str, List[int]] = {"(": [], "{": []}
 
-        while i < len(content):
-            char = content[i]
+        for match in _TOKEN_PATTERN.finditer(content):
+            kind = match.lastgroup
 
-            # Skip multi-line comments /* ... */
-            if i + 1 < len(content) and content[i : i + 2] == "/*":
-                end = content.find("*/", i + 2)
-                if end != -1:
-                    i = end + 2
-                    continue
-                else:
-                    break
-
-            # Skip single-line comments //
-            if i + 1 < len(content) and content[i : i + 2] == "//":
-                end = content.find("\n", i + 2)
-                if end != -1:
-                    i = end + 1
-                else:
-                    break
+            # Comments are consumed whole by the pattern
+            if kind == "comment":
                 continue
 
-            # Skip shell-style comments #
-            if char == "#":
-                end = content.find("\n", i + 1)
-                if end != -1:
-                    i = end + 1
+            # Unclosed comment or string: nothing after it is code
+            if kind == "unclosed":
+                break
+
+            # Pair up brackets
+            if kind == "bracket":
+                token = match.group()
+                if token in ("(", "{"):
+                    open_positions[token].append(match.start())
                 else:
-                    break
+                    open_char = "(" if token == ")" else "{"
+                    if open_positions[open_char]:
+                        bracket_matches[(open_char, open_positions[open_char].pop())] = match.start()
                 continue
 
-            # Check for string start
-            if char in ('"', "'"):
-                quote = char
-                start_pos = i
-                i += 1
-                string_chars = []
-
-                # Extract string content
-                while i < len(content):
-                    if content[i] == "\\" and i + 1 < len(content):
-                        # Escaped character - add both backslash and next char to string
-                        string_chars.append(content[i])
-                        string_chars.append(content[i + 1])
-                        i += 2
-                        continue
-                    elif content[i] == quote:
-                        # End of string found
-                        string_content = "".join(string_chars)
-
-                        # Only add non-empty, non-whitespace strings
-                        if string_content and not string_content.isspace():
-                            line, column = StringProcessor.get_line_column(content, start_pos + 1)
-                            results.append((string_content, line, column, len(string_content)))
-
-                        i += 1
-                        break
-                    else:
-                        string_chars.append(content[i])
-                        i += 1
-            else:
-                i += 1
+            # String literal (escaped characters are kept as written)
+            start_pos = match.start()
+            string_content = content[start_pos + 1 : match.end() - 1]
+
+            # Only add non-empty, non-whitespace strings
+            if string_content and not string_content.isspace():
+                # Line/column of the string content (after the opening quote) via the line start offsets
+                line = bisect_right(line_starts, start_pos + 1)
+                column = start_pos + 1 - line_starts[line - 1]
+                results.append((string_content, line, column, len(string_content)))
+
+        # Brackets still open were never closed in code
+        for open_char, positions in open_positions.items():
+            for position in positions:
+                bracket_matches[(open_char, position)] = -1
+        self._bracket_match_cache = (content, bracket_matches)
 
         return results
 
     # ========== PHP String Validation ==========
 
-    def should_include_string(self, text: str, content: str, line: int, column: int, validator_func) -> bool:
+    def should_include_string(self, text: str, content: str, line: int, column: int, validator_func, line_index: Optional[LineIndex] = None) -> bool:
         """
         Determine if a string should be included based on context.
 
@@ -644,6 +682,7 @@ class PHPAnalyzer:
             line: Line number (1-based)
             column: Column number (0-based)
             validator_func: Function for basic string validation (should_extract_string)
+            line_index: LineIndex of content. Built on demand (once per content) if not provided.
 
         Returns:
             True if the string should be included
@@ -652,12 +691,14 @@ class PHPAnalyzer:
         if not validator_func(text, self.min_bytes):
             return False
 
-        # Get context information
-        lines = content.split("\n")
-        if line < 1 or line > len(lines):
+        # Get context information (slice only the current line out of content)
+        if line_index is None:
+            line_index = self._get_line_index(content)
+        if line < 1 or line > len(line_index.offsets):
             return False
 
-        current_line = lines[line - 1]
+        line_start, line_end = line_index.get_line_span(line)
+        current_line = content[line_start:line_end]
 
         # before_string should NOT include the opening quote
         # column points to the first character of string content (after opening quote)
@@ -673,21 +714,19 @@ class PHPAnalyzer:
         after_with_quote = current_line[column + len(text) :]
 
         # Skip the closing quote (either ' or ")
+        # Leading whitespace is skipped by the array key check itself
         if after_with_quote and after_with_quote[0] in ("'", '"'):
-            after_string_raw = after_with_quote[1:]
+            after_string = after_with_quote[1:]
         else:
-            after_string_raw = after_with_quote
-
-        after_string = after_string_raw.lstrip()
+            after_string = after_with_quote
 
         # Check for exclusion patterns
-        if self._is_excluded_by_function_pattern(before_string):
+        if self._is_excluded_by_function_pattern(before_string, current_line):
             return False
 
         # Calculate position for array key check
-        # Get position for context check
-        position = StringProcessor.get_position_from_line_column(content, line, column)
-        if position == -1:
+        position = line_start + column
+        if position >= len(content):
             return True
 
         if self._is_array_key(before_string, after_string, content, position, len(text)):
@@ -695,23 +734,126 @@ class PHPAnalyzer:
 
         return True
 
-    def _is_excluded_by_function_pattern(self, before_string: str) -> bool:
+    def _get_line_index(self, content: str) -> LineIndex:
+        """
+        Get the line index of content, reusing it while the same content is analyzed.
+
+        Args:
+            content: Full file content
+
+        Returns:
+            LineIndex of content
+        """
+        cached_content, line_index = self._line_index_cache
+        if cached_content is not content or line_index is None:
+            line_index = LineIndex(content)
+            self._line_index_cache = (content, line_index)
+        return line_index
+
+    def _is_excluded_by_function_pattern(self, before_string: str, current_line: Optional[str] = None) -> bool:
         """
         Check if the string is excluded by any function pattern.
 
+        A string is excluded when an excluded function call appears anywhere before it
+        on the same line. Instead of searching every before_string, the patterns are searched
+        once per line and the string start is compared with the end of the first match.
+
         Args:
-            before_string: Context before the string on the same line
+            before_string: Context before the string on the same line (ends right before the opening quote)
+            current_line: Full line containing the string (default: before_string)
 
         Returns:
             True if the string should be excluded
         """
-        patterns = self._get_exclusion_patterns()
+        if current_line is None:
+            current_line = before_string
 
-        for pattern in patterns:
-            if re.search(pattern, before_string):
-                return True
+        return self._get_first_exclusion_end(current_line) <= len(before_string)
+
+    def _get_first_exclusion_end(self, line: str) -> int:
+        """
+        Get the end position of the first excluded function call in a line.
+
+        Excluded statements (echo/print) and call sites (identifier followed by "(") are found
+        together with a single regex; call site identifiers are looked up in the excluded name sets.
 
-        return False
+        Args:
+            line: Line text
+
+        Returns:
+            End position of the earliest ending match, or len(line) + 1 if nothing matches
+        """
+        first_end = self._exclusion_end_cache.get(line)
+        if first_end is not None:
+            return first_end
+
+        first_end = len(line) + 1
+
+        # Without "(" there is no call site, so only excluded statements (echo/print) can match
+        if "(" not in line:
+            match = self._EXCLUDED_STATEMENT_PATTERN.search(line)
+            if match:
+                first_end = match.end()
+            self._exclusion_end_cache[line] = first_end
+            return first_end
+
+        # Statements and call sites are found in order in one pass, so the first excluded one ends first
+        for match in self._EXCLUSION_SEARCH_PATTERN.finditer(line):
+            if match.group("statement") is not None or self._is_excluded_call(line, match.group("name"), match.start("name")):
+                first_end = match.end()
+                break
+
+        self._exclusion_end_cache[line] = first_end
+        return first_end
+
+    def _is_excluded_call(self, content: str, name: str, name_pos: int) -> bool:
+        """
+        Check if a call site refers to an excluded function or method.
+
+        Args:
+            content: Content containing the call site
+            name: Identifier directly before the opening parenthesis
+            name_pos: Position of the identifier in content
+
+        Returns:
+            True if the call is excluded
+        """
+        return self._get_excluded_call_start(content, name, name_pos) != -1
+
+    def _get_excluded_call_start(self, content: str, name: str, name_pos: int) -> int:
+        """
+        Get the start position of an excluded function or method call.
+
+        The call starts at its prefix when it has one ("$this->", "->", "::", "Class::", "@");
+        the earliest start is returned when several excluded forms match.
+
+        Args:
+            content: Content containing the call site
+            name: Identifier directly before the opening parenthesis
+            name_pos: Position of the identifier in content
+
+        Returns:
+            Start position of the excluded call, or -1 if the call is not excluded
+        """
+        start = -1
+
+        # Plain functions: func(
+        if name in self._EXCLUDED_CALL_NAMES:
+            start = name_pos
+
+        # Class instance methods: $this->method(, ->method(, ::method(
+        if name in self._EXCLUDED_METHOD_NAMES:
+            if content.endswith("$this->", 0, name_pos):
+                start = name_pos - 7
+            elif content.endswith(("->", "::"), 0, name_pos):
+                start = name_pos - 2
+
+        # Static methods and Blade directives: Class::method(, @directive(
+        for prefix in self._EXCLUDED_PREFIXED_CALL_NAMES.get(name, ()):
+            if content.endswith(prefix, 0, name_pos) and (start == -1 or name_pos - len(prefix) < start):
+                start = name_pos - len(prefix)
+
+        return start
 
     def _is_array_key(self, before_string: str, after_string: str, content: str, position: int, text_length: int) -> bool:
         """
@@ -729,7 +871,7 @@ class PHPAnalyzer:
 
         Args:
             before_string: Context before the string on the same line
-            after_string: Context after the string on the same line (already lstrip)
+            after_string: Context after the string's closing quote on the same line
             content: Full file content
             position: Character position in content
             text_length: Length of the text
@@ -737,37 +879,29 @@ class PHPAnalyzer:
         Returns:
             True if the string is an array key
         """
-        before_string_stripped = before_string.rstrip()
-
-        # Primary check: String is surrounded by [ and ]
-        # before_string should end with [ and after_string should start with ]
-        if before_string_stripped.endswith("[") and after_string.startswith("]"):
-            return True
+        # Same line checks with a single match of the first non-whitespace token after the string
+        after_match = _ARRAY_KEY_AFTER_PATTERN.match(after_string)
+        if after_match is not None:
+            # Associative array key: 'key' => value (same line)
+            if after_match.group(1) == "=>":
+                return True
 
-        # Associative array key: 'key' => value (same line)
-        if after_string.startswith("=>"):
-            return True
+            # Primary check: String is surrounded by [ and ]
+            # before_string should end with [ and after_string should start with ]
+            if before_string.rstrip().endswith("["):
+                return True
 
         # Associative array key: 'key' => value (multi-line)
+        # Matched in place within the next 100 characters, skipping the closing quote if present
         string_end_pos = position + text_length
-        remaining_content = content[string_end_pos : string_end_pos + 100]
-        remaining_stripped = remaining_content.lstrip()
-
-        # Skip closing quote if present
-        if remaining_stripped.startswith("'") or remaining_stripped.startswith('"'):
-            remaining_stripped = remaining_stripped[1:].lstrip()
-
-        if remaining_stripped.startswith("=>"):
-            return True
+        return _ARRAY_KEY_ARROW_PATTERN.match(content, string_end_pos, string_end_pos + 100) is not None
 
-        return False
-
-    def _identify_excluded_function_ranges(self, content: str) -> None:
+    def _identify_excluded_ranges(self, content: str) -> None:
         """
-        Identify all ranges of excluded function calls (entire function call including arguments).
+        Identify all ranges of excluded function calls and excluded function definitions.
 
-        This method finds all calls to excluded functions and marks the entire function call range
-        (from function name to closing parenthesis). This applies uniformly to ALL exclusion categories:
+        Function calls: the entire call including arguments (from function name to closing
+        parenthesis) is excluded. This applies uniformly to ALL exclusion categories:
         - Excluded functions (translation, console output, logging)
           Examples: __(), trans(), var_dump(), dd(), logger(), Log::error()
         - Laravel helpers (config(), route(), view(), etc.)
@@ -779,249 +913,229 @@ class PHPAnalyzer:
           → Entire range from 'Log::error(' to final ')' is excluded
         - config('app.name')
           → Entire range from 'config(' to ')' is excluded
-        - __('auth.failed')
-          → Entire range from '__(' to ')' is excluded
-        - logger('Processing ' . $count . ' items')
-          → Entire range from 'logger(' to ')' is excluded
         - $this->info('Processing...')
           → Entire range from '$this->info(' to ')' is excluded
-        - User::where('name', 'John')
-          → Entire range from '::where(' to ')' is excluded
+
+        Function definitions: the entire function including body is excluded.
+        STRICT MODE: Each definition pattern requires exact matches for:
+        1. Access level (e.g., "protected")
+        2. Function name (e.g., "casts")
+        3. Return type hint (e.g., ": array")
+
+        Examples:
+        - protected function casts(): array { return ['key' => 'array']; }
+          → Entire range from 'protected function casts' to final '}' is excluded
+        - public function casts(): array { ... }  // NOT excluded: wrong access level
+        - protected function casts() { ... }  // NOT excluded: missing return type
+
+        Both kinds are found in a single pass with _EXCLUDED_RANGE_PATTERN.
+        Excluded statements (echo/print) take no parenthesized argument list and produce no range.
 
         Args:
             content: PHP content to analyze
         """
         self._excluded_ranges = []
-        patterns = self._get_exclusion_patterns()
 
-        for pattern in patterns:
-            for match in re.finditer(pattern, content):
-                # match.end() - 1 points to the opening '(' in most cases
-                # Find the position of '(' after the function/method name
-                paren_pos = match.end() - 1
-
-                # Verify this is actually a '('
-                if paren_pos >= len(content) or content[paren_pos] != "(":
+        for match in self._EXCLUDED_RANGE_PATTERN.finditer(content):
+            if match.group("definition") is None:
+                # Call site: match.end() - 1 is the opening '('
+                call_start = self._get_excluded_call_start(content, match.group("name"), match.start("name"))
+                if call_start == -1:
                     continue
 
-                # Find the matching closing parenthesis
+                paren_pos = match.end() - 1
                 close_paren = self._find_matching_parenthesis(content, paren_pos)
 
                 if close_paren > paren_pos:
-                    # Exclude the entire function call (from start of match to closing paren)
-                    self._excluded_ranges.append((match.start(), close_paren + 1))
+                    # Exclude the entire function call (from start of the call including its prefix to closing paren)
+                    self._excluded_ranges.append((call_start, close_paren + 1))
+                continue
 
-    def _identify_excluded_function_definitions(self, content: str) -> None:
+            # Function definition: find the opening brace after the return type
+            # Allow for whitespace and possible comments, but stop at ';' (abstract method or interface definition, no body)
+            brace_search_start = match.end()
+            brace_search_end = min(brace_search_start + 100, len(content))
+            brace_start = content.find("{", brace_search_start, brace_search_end)
+            semicolon = content.find(";", brace_search_start, brace_search_end)
+            if brace_start == -1 or -1 < semicolon < brace_start:
+                continue
+
+            brace_end = self._find_matching_brace(content, brace_start)
+            if brace_end > brace_start:
+                # Exclude the entire function definition (from start of match to closing brace)
+                self._excluded_ranges.append((match.start(), brace_end + 1))
+
+    def _find_matching_parenthesis(self, content: str, open_paren_pos: int) -> int:
         """
-        Identify all ranges of excluded function definitions (entire function including body).
+        Find the matching closing parenthesis for an opening parenthesis.
 
-        STRICT MODE: This method uses highly specific patterns to avoid accidental exclusions.
-        Each pattern requires exact matches for:
-        1. Access level (e.g., "protected")
-        2. Function name (e.g., "casts")
-        3. Return type hint (e.g., ": array")
+        Args:
+            content: Content to search
+            open_paren_pos: Position of the opening '('
 
-        All three components must match for the function to be excluded.
+        Returns:
+            Position of matching ')', or -1 if not found
+        """
+        return self._get_matching_bracket(content, open_paren_pos, "(")
 
-        Examples (WILL be excluded):
-        - protected function casts(): array { return ['key' => 'array']; }
-          → Entire range from 'protected function casts' to final '}' is excluded
+    def _find_matching_brace(self, content: str, open_brace_pos: int) -> int:
+        """
+        Find the matching closing brace for an opening brace.
 
-        Examples (will NOT be excluded - missing components):
-        - public function casts(): array { ... }  // Wrong access level
-        - protected function casts() { ... }  // Missing return type
-        - protected function customCasts(): array { ... }  // Wrong function name
-        - private function casts(): array { ... }  // Wrong access level
+        Args:
+            content: Content to search
+            open_brace_pos: Position of the opening '{'
+
+        Returns:
+            Position of matching '}', or -1 if not found
+        """
+        return self._get_matching_bracket(content, open_brace_pos, "{")
+
+    def _get_matching_bracket(self, content: str, open_pos: int, open_char: str) -> int:
+        """
+        Get the matching closing bracket, memoized while the same content is analyzed.
 
         Args:
-            content: PHP content to analyze
+            content: Content to search
+            open_pos: Position of the opening bracket
+            open_char: Opening bracket, "(" or "{"
+
+        Returns:
+            Position of the matching closing bracket, or -1 if not found
         """
-        for access_level, func_name, return_type in self.EXCLUDED_FUNCTION_DEFINITIONS:
-            # Pattern: EXACT access level + function + EXACT function name + EXACT return type
-            # Example: "protected function casts(): array"
-            # \b ensures word boundary (no partial matches)
-            # \s* allows for flexible whitespace
-            pattern = rf"{re.escape(access_level)}\s+function\s+\b{re.escape(func_name)}\b\s*\(\s*\)\s*:\s*{re.escape(return_type)}"
-
-            for match in re.finditer(pattern, content):
-                # Find the opening brace after the return type
-                # match.end() is right after the return type (e.g., "array")
-                brace_search_start = match.end()
-                brace_start = -1
-
-                # Search for opening brace after return type
-                # Allow for whitespace and possible comments
-                for i in range(brace_search_start, min(brace_search_start + 100, len(content))):
-                    if content[i] == "{":
-                        brace_start = i
-                        break
-                    elif content[i] == ";":
-                        # Abstract method or interface definition, no body
-                        break
-
-                if brace_start != -1:
-                    brace_end = self._find_matching_brace(content, brace_start)
-                    if brace_end > brace_start:
-                        # Exclude the entire function definition (from start of match to closing brace)
-                        self._excluded_ranges.append((match.start(), brace_end + 1))
+        cached_content, matches = self._bracket_match_cache
+        if cached_content is not content:
+            matches = {}
+            self._bracket_match_cache = (content, matches)
+
+        key = (open_char, open_pos)
+        close_pos = matches.get(key)
+        if close_pos is None:
+            close_pos = self._find_matching_bracket(content, open_pos, open_char)
+            matches[key] = close_pos
+        return close_pos
 
-    def _find_matching_parenthesis(self, content: str, open_paren_pos: int) -> int:
+    @staticmethod
+    def _find_matching_bracket(content: str, open_pos: int, open_char: str) -> int:
         """
-        Find the matching closing parenthesis for an opening parenthesis.
+        Find the matching closing bracket for an opening parenthesis or brace.
 
         This correctly handles:
-        - Nested parentheses
-        - String literals containing parentheses
-        - Comments containing parentheses
+        - Nested brackets
+        - String literals containing brackets
+        - Comments containing brackets
 
         Args:
             content: Content to search
-            open_paren_pos: Position of the opening '('
+            open_pos: Position of the opening bracket
+            open_char: Opening bracket, "(" or "{"
 
         Returns:
-            Position of matching ')', or -1 if not found
+            Position of the matching closing bracket, or -1 if not found
         """
-        if open_paren_pos >= len(content) or content[open_paren_pos] != "(":
+        if open_pos >= len(content) or content[open_pos] != open_char:
             return -1
 
+        stop_pattern = _BRACKET_STOP_PATTERNS[open_char]
         depth = 1
-        i = open_paren_pos + 1
+        i = open_pos + 1
+
+        while True:
+            # Jump straight to the next character that matters (comment start, quote, or bracket)
+            match = stop_pattern.search(content, i)
+            if match is None:
+                return -1
 
-        while i < len(content) and depth > 0:
-            char = content[i]
+            token = match.group()
+            i = match.start()
 
             # Skip multi-line comments /* ... */
-            if i + 1 < len(content) and content[i : i + 2] == "/*":
+            if token == "/*":
                 end = content.find("*/", i + 2)
-                if end != -1:
-                    i = end + 2
-                    continue
-                else:
-                    return -1
-
-            # Skip single-line comments //
-            if i + 1 < len(content) and content[i : i + 2] == "//":
-                end = content.find("\n", i + 2)
-                if end != -1:
-                    i = end + 1
-                else:
+                if end == -1:
                     return -1
+                i = end + 2
                 continue
 
-            # Skip shell-style comments #
-            if char == "#":
-                end = content.find("\n", i + 1)
-                if end != -1:
-                    i = end + 1
-                else:
+            # Skip single-line comments // and shell-style comments #
+            if token in ("//", "#"):
+                end = content.find("\n", i + len(token))
+                if end == -1:
                     return -1
+                i = end + 1
                 continue
 
-            # Handle string literals
-            if char in ('"', "'"):
-                quote = char
-                i += 1
-                while i < len(content):
-                    if content[i] == "\\" and i + 1 < len(content):
-                        i += 2
-                        continue
-                    elif content[i] == quote:
-                        i += 1
-                        break
-                    else:
-                        i += 1
+            # Skip string literals in one step
+            if token in ('"', "'"):
+                string_match = _STRING_TAIL_PATTERNS[token].match(content, i + 1)
+                if string_match is None:
+                    return -1  # Unclosed string
+                i = string_match.end()
                 continue
 
-            # Count parentheses
-            if char == "(":
+            # Count brackets
+            if token == open_char:
                 depth += 1
-            elif char == ")":
+            else:
                 depth -= 1
                 if depth == 0:
                     return i
 
             i += 1
 
-        return -1
+    def _pack_excluded_ranges(self) -> None:
+        """
+        Merge excluded ranges into sorted, non-overlapping start/end arrays for binary search.
 
-    def _find_matching_brace(self, content: str, open_brace_pos: int) -> int:
+        Overlapping and adjacent ranges (e.g. nested excluded calls) are merged into one.
         """
-        Find the matching closing brace for an opening brace.
+        starts = array("q")
+        ends = array("q")
 
-        This correctly handles:
-        - Nested braces
-        - String literals containing braces
-        - Comments containing braces
+        for start, end in sorted(self._excluded_ranges):
+            if ends and start <= ends[-1]:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
 
-        Args:
-            content: Content to search
-            open_brace_pos: Position of the opening '{'
+        self._excluded_starts = starts
+        self._excluded_ends = ends
 
-        Returns:
-            Position of matching '}', or -1 if not found
+    def _get_excluded_position_flags(self, positions: List[int]) -> List[bool]:
         """
-        if open_brace_pos >= len(content) or content[open_brace_pos] != "{":
-            return -1
+        Check many positions against the excluded function call ranges at once.
 
-        depth = 1
-        i = open_brace_pos + 1
-
-        while i < len(content) and depth > 0:
-            char = content[i]
+        Positions in ascending order (as extracted string literals are) are classified by
+        a single merge walk over the packed ranges; otherwise each position is looked up
+        with _is_in_excluded_function_range.
 
-            # Skip multi-line comments /* ... */
-            if i + 1 < len(content) and content[i : i + 2] == "/*":
-                end = content.find("*/", i + 2)
-                if end != -1:
-                    i = end + 2
-                    continue
-                else:
-                    return -1
-
-            # Skip single-line comments //
-            if i + 1 < len(content) and content[i : i + 2] == "//":
-                end = content.find("\n", i + 2)
-                if end != -1:
-                    i = end + 1
-                else:
-                    return -1
-                continue
+        Args:
+            positions: Character positions in content
 
-            # Skip shell-style comments #
-            if char == "#":
-                end = content.find("\n", i + 1)
-                if end != -1:
-                    i = end + 1
-                else:
-                    return -1
-                continue
+        Returns:
+            List of flags, True where the position is within an excluded range
+        """
+        if not self._excluded_starts:
+            return [False] * len(positions)
 
-            # Handle string literals
-            if char in ('"', "'"):
-                quote = char
-                i += 1
-                while i < len(content):
-                    if content[i] == "\\" and i + 1 < len(content):
-                        i += 2
-                        continue
-                    elif content[i] == quote:
-                        i += 1
-                        break
-                    else:
-                        i += 1
-                continue
+        if any(positions[i] > positions[i + 1] for i in range(len(positions) - 1)):
+            return [self._is_in_excluded_function_range(position) for position in positions]
 
-            # Count braces
-            if char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    return i
+        starts = self._excluded_starts
+        ends = self._excluded_ends
+        range_count = len(starts)
+        flags = []
+        index = 0
 
-            i += 1
+        for position in positions:
+            # Advance past ranges that end at or before this position
+            while index < range_count and ends[index] <= position:
+                index += 1
+            flags.append(index < range_count and starts[index] <= position)
 
-        return -1
+        return flags
 
     def _is_in_excluded_function_range(self, position: int) -> bool:
         """
@@ -1036,8 +1150,6 @@ class PHPAnalyzer:
         if position == -1:
             return False
 
-        for start, end in self._excluded_ranges:
-            if start <= position < end:
-                return True
-
-        return False
+        # Last range starting at or before position
+        index = bisect_right(self._excluded_starts, position) - 1
+        return index >= 0 and position < self._excluded_ends[index]
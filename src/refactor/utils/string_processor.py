@@ -4,6 +4,7 @@ String processing utilities.
 Consolidated module for all string-related processing:
 - String validation
 - Text adjustment (whitespace stripping with position correction)
+- Line/column lookups (LineIndex)
 - String collection and consolidation
 
 This module combines functionality from:
@@ -13,12 +14,34 @@ This module combines functionality from:
 """
 
 import re
-from typing import Dict, List, Optional, Tuple
-from pathlib import Path
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from ..data_models.string_occurrence import StringOccurrence
 from .exclusion_dict import ExclusionMatcher
 
+# Every ASCII byte except letters (digits, symbols, whitespace, control characters).
+# Deleting these with bytes.translate leaves only what should_extract_string keeps.
+_ASCII_NON_LETTER_BYTES = bytes(code for code in range(128) if not (65 <= code <= 90 or 97 <= code <= 122))
+
+# Strings that are only escape sequences (e.g., \n, \t, \r, \r\n, etc.)
+_ESCAPE_ONLY_PATTERN = re.compile(r'^(\\[ntrfvabe\\"\'])+$')
+
+# Prefixes that exclude a string (see should_extract_string), tried in one anchored match:
+# - URL schemes: URLs should never be translated as they are technical references
+#   Supported schemes: http, https, ftp, ftps, file, mailto, tel, sms, data, javascript, ws, wss
+# - regex patterns: (?:, (?=, (?!, (?<, \d, \w, \s, \b, ^[, ^\
+# - symbols that cannot be at the beginning of sentences/words: # , / $ . and various punctuation marks
+_REJECT_PREFIX_PATTERN = re.compile(
+    r"(?i:https?|ftps?|file|mailto|tel|sms|data|javascript|ws|wss):"
+    r"|\(\?[:=!<]"
+    r"|\\[dwsb]"
+    r"|\^[\[\\]"
+    r"|[#,/$.!:;)\]}%&@?^~`]"
+)
+
 
 class StringProcessor:
     """
@@ -38,9 +61,10 @@ class StringProcessor:
         Returns:
             True if string contains any character with code > 127
         """
-        return any(ord(char) > 127 for char in text)
+        return not text.isascii()
 
     @staticmethod
+    @lru_cache(maxsize=65536)
     def should_extract_string(text: str, min_bytes: int) -> bool:
         """
         Determine if a string should be extracted for translation.
@@ -60,6 +84,9 @@ class StringProcessor:
         If nothing remains after removal, the string is excluded.
         If anything remains, the string should be extracted.
 
+        The result depends only on the arguments, so it is cached: the same labels
+        and keys repeat across many files.
+
         Args:
             text: String to validate
             min_bytes: Minimum byte length (only applies to ASCII-only strings)
@@ -67,86 +94,40 @@ class StringProcessor:
         Returns:
             True if string should be extracted, False otherwise
         """
-        # Empty or whitespace-only strings are excluded
-        if not text or not text.strip():
-            return False
-
         # Create a temporary copy for checking
         check_text = text.strip()
 
+        # Empty or whitespace-only strings are excluded
+        if not check_text:
+            return False
+
         # Exclude strings that are only escape sequences (e.g., \n, \t, \r, \r\n, etc.)
         # These are common in code configuration but not translatable text
-        escape_only_pattern = r'^(\\[ntrfvabe\\"\'])+$'
-        if re.match(escape_only_pattern, check_text):
+        if _ESCAPE_ONLY_PATTERN.match(check_text):
             return False
 
-        # Exclude URL patterns
-        # URLs should never be translated as they are technical references
-        # Supported schemes: http, https, ftp, ftps, file, mailto, tel, sms, data, javascript, ws, wss
-        url_pattern = r"^(https?|ftps?|file|mailto|tel|sms|data|javascript|ws|wss):"
-        if re.match(url_pattern, check_text, re.IGNORECASE):
+        # Exclude URLs, regex patterns and strings starting with symbols that cannot be
+        # at the beginning of sentences/words, with one anchored match
+        # This applies to all strings, regardless of whether they contain non-ASCII characters
+        if _REJECT_PREFIX_PATTERN.match(check_text):
             return False
 
-        # Check if string contains non-ASCII characters
-        has_non_ascii = StringProcessor.contains_non_ascii(check_text)
+        # Check if string contains non-ASCII characters (same as contains_non_ascii, without the class lookup)
+        has_non_ascii = not check_text.isascii()
 
         # Check minimum byte length only for ASCII-only strings
         # Non-ASCII strings (e.g., Japanese, emoji) bypass this check
-        if not has_non_ascii and len(check_text.encode("utf-8")) < min_bytes:
-            return False
-
-        # Exclude regex patterns (e.g., (?:, (?=, (?!, [0-9], \d, \w, etc.)
-        regex_patterns = [
-            "(?:",  # non-capturing group
-            "(?=",  # positive lookahead
-            "(?!",  # negative lookahead
-            "(?<",  # lookbehind
-            "\\d",
-            "\\w",
-            "\\s",
-            "\\b",  # escape sequences
-            "^[",
-            "^\\",  # start anchors with character class or escape
-        ]
-        for pattern in regex_patterns:
-            if check_text.startswith(pattern):
-                return False
-
-        # Exclude strings starting with symbols that cannot be at the beginning of sentences/words
-        # These are: # , / $ . and various punctuation marks
-        # This applies to all strings, regardless of whether they contain non-ASCII characters
-        invalid_start_chars = {"#", ",", "/", "$", ".", "!", ":", ";", ")", "]", "}", "%", "&", "@", "?", "^", "~", "`"}
-        if check_text and check_text[0] in invalid_start_chars:
+        # ASCII-only text encodes to one UTF-8 byte per character, so no encoding is needed
+        if not has_non_ascii and len(check_text) < min_bytes:
             return False
 
         # Remove half-width digits, symbols, whitespace (space, tab, CR, LF)
-        filtered_chars = []
-        for char in check_text:
-            char_code = ord(char)
-
-            # Skip half-width digits (0-9: ASCII 48-57)
-            if 48 <= char_code <= 57:
-                continue
-
-            # Skip whitespace (space, tab, CR, LF)
-            if char in (" ", "\t", "\r", "\n"):
-                continue
+        # Non-ASCII characters always remain, so only ASCII-only strings need filtering
+        if has_non_ascii:
+            return True
 
-            # Skip half-width symbols (ASCII < 128 and not alphanumeric)
-            if char_code < 128:
-                # ASCII letters (a-z: 97-122, A-Z: 65-90) should be kept
-                if not ((65 <= char_code <= 90) or (97 <= char_code <= 122)):
-                    continue
-
-            # Keep this character (either non-ASCII or ASCII letter)
-            filtered_chars.append(char)
-
-        # If nothing remains after filtering, exclude the string
-        if not filtered_chars:
-            return False
-
-        # If something remains, extract the string
-        return True
+        # Delete every non-letter in one C-level pass; if nothing remains, exclude the string
+        return bool(check_text.encode("ascii").translate(None, _ASCII_NON_LETTER_BYTES))
 
     @staticmethod
     def get_line_column(content: str, pos: int) -> Tuple[int, int]:
@@ -160,11 +141,30 @@ class StringProcessor:
         Returns:
             Tuple of (line, column) where line is 1-based and column is 0-based
         """
-        lines_before = content[:pos].split("\n")
-        line = len(lines_before)
-        column = len(lines_before[-1]) if lines_before else 0
+        # Count and search in place instead of splitting a copy of content[:pos]
+        pos = min(pos, len(content))
+        line = content.count("\n", 0, pos) + 1
+        column = pos - (content.rfind("\n", 0, pos) + 1)
         return line, column
 
+    @staticmethod
+    def get_line_starts(content: str) -> List[int]:
+        """
+        Calculate the start position of every line in content.
+
+        Args:
+            content: Full content
+
+        Returns:
+            List of positions (0-based) where each line starts; index 0 is line 1
+        """
+        line_starts = [0]
+        pos = content.find("\n")
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = content.find("\n", pos + 1)
+        return line_starts
+
     @staticmethod
     def get_position_from_line_column(content: str, line: int, column: int) -> int:
         """
@@ -212,6 +212,73 @@ class StringProcessor:
         return stripped_text, adjusted_column, stripped_length
 
 
+class LineIndex:
+    """
+    Line start offsets of a content, for repeated position lookups.
+
+    Built once per content; each lookup is a binary search instead of a scan of the content.
+    """
+
+    def __init__(self, content: str):
+        """
+        Initialize the index.
+
+        Args:
+            content: Full content
+        """
+        self.content_length = len(content)
+        # Packed 64-bit offsets (8 bytes per line instead of a list of int objects); bisect works on them directly
+        self.offsets = array("q", StringProcessor.get_line_starts(content))
+
+    def get_line_column(self, pos: int) -> Tuple[int, int]:
+        """
+        Calculate line and column number for a position (same result as StringProcessor.get_line_column).
+
+        Args:
+            pos: Position in content (0-based)
+
+        Returns:
+            Tuple of (line, column) where line is 1-based and column is 0-based
+        """
+        pos = min(pos, self.content_length)
+        line = bisect_right(self.offsets, pos)
+        return line, pos - self.offsets[line - 1]
+
+    def get_position(self, line: int, column: int) -> int:
+        """
+        Get position from line and column (same result as StringProcessor.get_position_from_line_column).
+
+        Args:
+            line: Line number (1-based)
+            column: Column number (0-based)
+
+        Returns:
+            Position in content, or -1 if invalid
+        """
+        if line < 1 or line > len(self.offsets):
+            return -1
+
+        pos = self.offsets[line - 1] + column
+        if pos >= self.content_length:
+            return -1
+
+        return pos
+
+    def get_line_span(self, line: int) -> Tuple[int, int]:
+        """
+        Get the start and end position of a line.
+
+        Args:
+            line: Line number (1-based, must be valid)
+
+        Returns:
+            Tuple of (start, end) where end is the position of the line's newline (or the content end)
+        """
+        start = self.offsets[line - 1]
+        end = self.offsets[line] - 1 if line < len(self.offsets) else self.content_length
+        return start, end
+
+
 class StringCollector:
     """
     Collects and consolidates extracted strings from multiple files.
@@ -226,19 +293,19 @@ class StringCollector:
         Args:
             exclude_matcher: ExclusionMatcher for pattern-based exclusion
         """
-        # Dictionary mapping text to list of (file_path, occurrences)
-        self.strings: Dict[str, List[Tuple[str, List[StringOccurrence]]]] = {}
+        # Dictionary mapping text to {absolute file path: occurrences} (insertion ordered)
+        self.strings: Dict[str, Dict[str, List[StringOccurrence]]] = {}
 
         # Use the provided exclusion matcher
         self.exclude_matcher = exclude_matcher
 
-    def add_string(self, text: str, file_path: Path, line: int, column: int, length: int, context: Optional[List[str]] = None) -> None:
+    def add_string(self, text: str, absolute_path: str, line: int, column: int, length: int, context: Optional[List[str]] = None) -> None:
         """
         Add a string occurrence.
 
         Args:
             text: The extracted string content
-            file_path: Path to the source file
+            absolute_path: Resolved absolute path of the source file (resolve once per file)
             line: Line number (1-based)
             column: Column number (0-based)
             length: String length in characters
@@ -250,25 +317,20 @@ class StringCollector:
         if self.exclude_matcher.should_exclude(text_stripped):
             return
 
-        # Use absolute path
-        absolute_path = str(file_path.resolve())
-
         # Create occurrence
         occurrence = StringOccurrence(line, column, length, context)
 
         # Add to collection
-        if text not in self.strings:
-            self.strings[text] = []
-
-        # Find existing file entry
-        for file_entry in self.strings[text]:
-            if file_entry[0] == absolute_path:
-                # Add to existing file's occurrences
-                file_entry[1].append(occurrence)
-                return
+        file_occurrences = self.strings.get(text)
+        if file_occurrences is None:
+            file_occurrences = self.strings[text] = {}
 
-        # Create new file entry
-        self.strings[text].append((absolute_path, [occurrence]))
+        # Add to the file's occurrences (new file entries keep first-seen order)
+        positions = file_occurrences.get(absolute_path)
+        if positions is None:
+            file_occurrences[absolute_path] = [occurrence]
+        else:
+            positions.append(occurrence)
 
     def get_results(self) -> List[Dict]:
         """
@@ -290,17 +352,30 @@ class StringCollector:
                 }
             ]
         """
-        results = []
+        return list(self.iter_results())
+
+    def iter_results(self, sort_by_text: bool = False) -> Iterator[Dict]:
+        """
+        Yield consolidated results one text at a time (same items as get_results).
+
+        Each result dictionary is built only when it is consumed, so a streaming writer
+        never holds the whole output in memory.
+
+        Args:
+            sort_by_text: Yield results ordered by text instead of first-seen order
+
+        Yields:
+            Dictionary per unique text with "text" and "occurrences" keys
+        """
+        texts = sorted(self.strings) if sort_by_text else self.strings
 
-        for text, file_occurrences in self.strings.items():
+        for text in texts:
             occurrences = []
 
-            for file_path, positions in file_occurrences:
+            for file_path, positions in self.strings[text].items():
                 occurrences.append({"file": file_path, "positions": [pos.to_dict() for pos in positions]})
 
-            results.append({"text": text, "occurrences": occurrences})
-
-        return results
+            yield {"text": text, "occurrences": occurrences}
 
     def get_string_count(self) -> int:
         """Get the number of unique strings collected."""
@@ -310,6 +385,6 @@ class StringCollector:
         """Get the total number of string occurrences."""
         total = 0
         for file_occurrences in self.strings.values():
-            for _, positions in file_occurrences:
+            for positions in file_occurrences.values():
                 total += len(positions)
         return total
@@ -0,0 +1,111 @@
+"""
+Tests for parallel file analysis in the extract action.
+"""
+
+from concurrent.futures.process import BrokenProcessPool
+
+from refactor.actions import extract
+
+BLADE_SOURCE = """<div>
+    <h1>Welcome to the dashboard</h1>
+    <p>{{ __('messages.greeting') }}</p>
+    <button class="btn btn-primary">Save changes</button>
+    @php
+        $title = "Monthly report";
+        $key = $config['report_title'];
+    @endphp
+    <span>保存する</span>
+</div>
+"""
+
+PHP_SOURCE = """<?php
+
+class ReportController
+{
+    public function show()
+    {
+        Log::info('Showing report');
+        $message = "The report is ready";
+        return view('reports.show', ['title' => 'Quarterly report']);
+    }
+}
+"""
+
+
+def _write_project(tmp_path):
+    """Create a small project with Blade, PHP and disabled files."""
+    files = []
+    for index in range(3):
+        blade_file = tmp_path / f"view{index}.blade.php"
+        blade_file.write_text(BLADE_SOURCE.replace("dashboard", f"dashboard {index}"), encoding="utf-8")
+        files.append(blade_file)
+
+        php_file = tmp_path / f"Controller{index}.php"
+        php_file.write_text(PHP_SOURCE.replace("ready", f"ready {index}"), encoding="utf-8")
+        files.append(php_file)
+
+    broken_file = tmp_path / "broken.blade.php"
+    broken_file.write_bytes(b"<p>\xff\xfe invalid utf-8</p>")
+    files.append(broken_file)
+
+    return files
+
+
+def _summarize(outcomes):
+    """Convert analyze_files output into comparable plain values."""
+    summary = []
+    for file_path, results, error in outcomes:
+        strings = None if results is None else [(s.text, s.line, s.column, s.length) for s in results]
+        summary.append((file_path, strings, error))
+    return summary
+
+
+def test_pool_and_serial_analysis_return_same_results(tmp_path):
+    files = _write_project(tmp_path)
+
+    serial = _summarize(extract.analyze_files(files, 2, True, True, jobs=1))
+    parallel = _summarize(extract.analyze_files(files, 2, True, True, jobs=2))
+
+    assert parallel == serial
+    assert [file_path for file_path, _strings, _error in serial] == files
+    assert any(strings for _file_path, strings, _error in serial)
+    # Per-file errors are reported, not raised
+    assert serial[-1][1] is None and serial[-1][2]
+
+
+def test_disabled_file_types_keep_their_position(tmp_path):
+    files = _write_project(tmp_path)
+
+    serial = _summarize(extract.analyze_files(files, 2, True, False, jobs=1))
+    parallel = _summarize(extract.analyze_files(files, 2, True, False, jobs=2))
+
+    assert parallel == serial
+    for file_path, strings, error in serial:
+        if not file_path.name.endswith(".blade.php"):
+            assert strings is None and error is None
+
+
+def test_pool_failure_falls_back_to_serial_analysis(tmp_path, monkeypatch):
+    files = _write_project(tmp_path)
+    serial = _summarize(extract.analyze_files(files, 2, True, True, jobs=1))
+
+    class BrokenExecutor:
+        """Executor that delivers one outcome and then fails like a crashed pool."""
+
+        def __init__(self, max_workers):
+            self.max_workers = max_workers
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def map(self, func, *iterables, chunksize=1):
+            arguments = list(zip(*iterables))
+            yield func(*arguments[0])
+            raise BrokenProcessPool("worker crashed")
+
+    monkeypatch.setattr(extract, "ProcessPoolExecutor", BrokenExecutor)
+
+    assert _summarize(extract.analyze_files(files, 2, True, True, jobs=2)) == serial
@@ -0,0 +1,65 @@
+"""
+Tests for LineIndex position lookups.
+"""
+
+import pytest
+
+from refactor.utils.string_processor import LineIndex, StringProcessor
+
+
+def _split_line_column(content, pos):
+    """Reference line/column calculation (the original split-based implementation)."""
+    lines_before = content[:pos].split("\n")
+    return len(lines_before), len(lines_before[-1]) if lines_before else 0
+
+
+def _split_position(content, line, column):
+    """Reference position calculation (the original split-based implementation)."""
+    lines = content.split("\n")
+    if line < 1 or line > len(lines):
+        return -1
+    pos = sum(len(lines[i]) + 1 for i in range(line - 1)) + column
+    return -1 if pos >= len(content) else pos
+
+
+CONTENTS = [
+    "",
+    "single line",
+    "first\nsecond\nthird",
+    "trailing newline\n",
+    "\n\nleading blank lines",
+    "windows\r\nline\r\nendings\r\n",
+    "mixed\r\nendings\nhere\r\n\r\n",
+    "日本語の行\nemoji 😀 line\n",
+]
+
+
+@pytest.mark.parametrize("content", CONTENTS)
+def test_line_column_matches_split_implementation(content):
+    line_index = LineIndex(content)
+
+    for pos in range(len(content) + 2):
+        expected = _split_line_column(content, min(pos, len(content)))
+        assert line_index.get_line_column(pos) == expected
+        assert StringProcessor.get_line_column(content, pos) == expected
+
+
+@pytest.mark.parametrize("content", CONTENTS)
+def test_position_matches_split_implementation(content):
+    line_index = LineIndex(content)
+    line_count = content.count("\n") + 1
+
+    for line in range(0, line_count + 2):
+        for column in range(0, 6):
+            expected = _split_position(content, line, column)
+            assert line_index.get_position(line, column) == expected
+            assert StringProcessor.get_position_from_line_column(content, line, column) == expected
+
+
+@pytest.mark.parametrize("content", CONTENTS)
+def test_line_span_covers_line_without_newline(content):
+    line_index = LineIndex(content)
+
+    for line, text in enumerate(content.split("\n"), 1):
+        start, end = line_index.get_line_span(line)
+        assert content[start:end] == text
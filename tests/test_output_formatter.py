@@ -0,0 +1,48 @@
+"""
+Tests for streaming JSON output.
+"""
+
+import io
+import json
+
+import pytest
+
+from refactor.utils.output_formatter import _write_json_items, format_output
+
+RESULTS = [
+    {
+        "text": "保存する",
+        "occurrences": [
+            {
+                "file": "/project/resources/views/form.blade.php",
+                "positions": [
+                    {"line": 3, "column": 12, "length": 4, "context": ["<form>", "  <button>保存する</button>", "</form>"]},
+                    {"line": 9, "column": 4, "length": 4},
+                ],
+            }
+        ],
+    },
+    {"text": 'Quote " and \\ backslash\nnewline', "occurrences": []},
+    {"text": "Emoji 😀", "occurrences": [{"file": "/project/a.php", "positions": []}]},
+]
+
+
+@pytest.mark.parametrize("items", [[], RESULTS[:1], RESULTS])
+def test_write_json_items_matches_json_dumps(items):
+    stream = io.StringIO()
+
+    _write_json_items(iter(items), stream)
+
+    assert stream.getvalue() == json.dumps(items, ensure_ascii=False, indent=2, sort_keys=False)
+
+
+def test_presorted_output_matches_sorted_output(tmp_path):
+    unsorted_results = [RESULTS[2], RESULTS[0], RESULTS[1]]
+    sorted_results = sorted(unsorted_results, key=lambda x: x["text"])
+
+    sorted_files = format_output(unsorted_results, tmp_path / "sorted.json", 2)
+    presorted_files = format_output(iter(sorted_results), tmp_path / "presorted.json", 2, presorted=True, total_items=len(sorted_results))
+
+    assert [path.name for path in sorted_files] == ["sorted-1.json", "sorted-2.json"]
+    assert [path.read_text(encoding="utf-8") for path in presorted_files] == [path.read_text(encoding="utf-8") for path in sorted_files]
+    assert json.loads(sorted_files[0].read_text(encoding="utf-8")) == sorted_results[:2]